@@ -178,7 +178,7 @@ class RunManager:
             for player in players
         ]
         seed_blob = json.dumps({"seed": seed, "players": players_blob}, sort_keys=True)
-        digest = hashlib.sha1(seed_blob.encode("utf-8")).hexdigest()[:8]
+        digest = hashlib.blake2b(seed_blob.encode("utf-8"), digest_size=4).hexdigest()
         return f"mock-{seed}-{digest}"
 
     async def _record_decision(self, entry: dict[str, Any]) -> None:
@@ -30,3 +30,14 @@ def test_api_shims_delegate_to_arena() -> None:
     assert api_prompting.PromptMemory is arena_prompting.PromptMemory
     assert api_prompting.build_prompt_bundle is arena_prompting.build_prompt_bundle
 
+
+
+def test_api_paths_follow_repo_root_override(monkeypatch, tmp_path) -> None:
+    import monopoly_api.paths as api_paths
+
+    (tmp_path / "contracts").mkdir()
+    monkeypatch.setenv("MONOPOLY_REPO_ROOT", str(tmp_path))
+    root = tmp_path.resolve()
+    assert api_paths.contracts_schema_path("action.schema.json") == root / "contracts" / "schemas" / "action.schema.json"
+    assert api_paths.api_dir() == root / "python" / "apps" / "api"
+    assert api_paths.resolve_repo_path("runs") == root / "runs"
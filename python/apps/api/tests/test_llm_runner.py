@@ -2,9 +2,14 @@ import asyncio
 import json
 from typing import Any, Callable
 
+import pytest
 from monopoly_arena import OpenRouterResult
+from monopoly_arena.llm_runner import tool_call_to_action
 from monopoly_arena.prompting import (
     PromptMemory,
+    _encode_user_content,
+    _with_retry_notes,
+    build_buy_or_auction_decision_focus,
     build_openrouter_tools,
     build_prompt_bundle,
     build_space_key_by_index,
@@ -390,6 +395,32 @@ def test_prompt_payload_shape(tmp_path) -> None:
         assert tool["args"] == {}
 
 
+def test_tool_call_name_normalized_to_legal_action() -> None:
+    decision = {
+        "decision_id": "dec-norm",
+        "legal_actions": [{"action": "buy_property"}, {"action": "start_auction"}],
+    }
+    action = tool_call_to_action(decision, {"name": " Buy-Property ", "arguments": "{}"})
+    assert action is not None
+    assert action["action"] == "buy_property"
+    assert tool_call_to_action(decision, {"name": "end_turn", "arguments": "{}"}) is None
+
+
+def test_tool_call_arguments_accept_stdlib_json() -> None:
+    decision = {
+        "decision_id": "dec-args",
+        "legal_actions": [{"action": "bid_auction"}],
+    }
+    action = tool_call_to_action(
+        decision,
+        {"name": "bid_auction", "arguments": '{"bid_amount": 18446744073709551617, "confidence": NaN}'},
+    )
+    assert action is not None
+    assert action["args"]["bid_amount"] == 2**64 + 1
+    assert action["args"]["confidence"] != action["args"]["confidence"]
+    assert tool_call_to_action(decision, {"name": "bid_auction", "arguments": "{not json"}) is None
+
+
 def test_jail_decision_focus_shape() -> None:
     players_state = [
         {"player_id": "p1", "name": "P1"},
@@ -427,6 +458,153 @@ def test_jail_decision_focus_shape() -> None:
         assert "args" not in tool
 
 
+def test_prompt_user_content_matches_ascii_json() -> None:
+    players_state = [
+        {"player_id": "p1", "name": "Zo\u00eb"},
+        {"player_id": "p2", "name": "P2"},
+        {"player_id": "p3", "name": "P3"},
+        {"player_id": "p4", "name": "P4"},
+    ]
+    engine = Engine(seed=5, players=players_state, run_id="run-user-content", max_turns=1, ts_step_ms=1)
+    _, _, decision, _ = engine.advance_until_decision(max_steps=1)
+    assert decision is not None
+
+    space_key_by_index = build_space_key_by_index()
+    for name in ("P1", "Zo\u00eb"):
+        decision["state"]["players"][0]["name"] = name
+        prompt = build_prompt_bundle(
+            decision,
+            _make_player("p1", "P1"),
+            memory=PromptMemory(space_key_by_index=space_key_by_index),
+            space_key_by_index=space_key_by_index,
+        )
+        assert prompt.user_content == json.dumps(prompt.user_payload, ensure_ascii=True, separators=(",", ":"))
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"cash": 1500, "name": "P1", "owned": [1, 3], "flags": {"in_jail": False, "note": None}},
+        {"name": "Zo\u00eb"},
+        {"ratio": 1e16, "tiny": 1e-7, "half": 0.5},
+        {"values": [float("nan"), float("inf"), -float("inf")]},
+        {"seed": 2**64 + 1, "nested": {"big": -(2**70)}},
+        {1: "int key", 2.5: "float key"},
+    ],
+)
+def test_user_content_encoding_matches_stdlib(payload: dict[Any, Any]) -> None:
+    assert _encode_user_content(payload) == json.dumps(payload, ensure_ascii=True, separators=(",", ":"))
+
+
+def test_buy_focus_reads_sparse_board() -> None:
+    decision = {
+        "decision_id": "dec-sparse",
+        "decision_type": "BUY_OR_AUCTION_DECISION",
+        "player_id": "p1",
+        "legal_actions": [{"action": "buy_property"}],
+        "state": {
+            "players": [{"player_id": "p1", "position": 39}],
+            "board": [
+                {"index": 37, "kind": "PROPERTY", "group": "DARK_BLUE", "price": 350, "owner_id": "p1"},
+                {"index": 39, "kind": "PROPERTY", "group": "DARK_BLUE", "price": 400, "owner_id": None},
+            ],
+        },
+    }
+    focus = build_buy_or_auction_decision_focus(decision, space_key_by_index=build_space_key_by_index())
+    scenario = focus["scenario"]
+    assert scenario["space_kind"] == "PROPERTY"
+    assert scenario["price"] == 400
+    assert scenario["rent"]
+    assert scenario["group_progress"] == {"you_own_in_group": 1, "total_in_group": 2}
+
+
+def test_prompt_memory_snapshot_is_stable_across_updates() -> None:
+    memory = PromptMemory()
+    memory.update({"type": "LLM_PUBLIC_MESSAGE", "turn_index": 1, "payload": {"player_id": "p2", "message": "hi"}})
+    first = memory.snapshot_for_player("p1")
+    assert memory.snapshot_for_player("p1")["public_chat_last_20"] is first["public_chat_last_20"]
+
+    memory.update({"type": "LLM_PRIVATE_THOUGHT", "turn_index": 2, "payload": {"player_id": "p1", "thought": "buy"}})
+    second = memory.snapshot_for_player("p1")
+    assert second is not first
+    assert first["your_private_thoughts_last_10"] == ()
+    assert [entry["thought"] for entry in second["your_private_thoughts_last_10"]] == ["buy"]
+    assert [entry["message"] for entry in second["public_chat_last_20"]] == ["hi"]
+
+
+def _scribble(value: Any) -> None:
+    if isinstance(value, dict):
+        for item in list(value.values()):
+            _scribble(item)
+        value["scribbled"] = True
+    elif isinstance(value, list):
+        for item in list(value):
+            _scribble(item)
+        value.append("scribbled")
+
+
+def test_prompt_build_does_not_share_mutable_state_between_prompts() -> None:
+    players_state = [
+        {"player_id": "p1", "name": "P1"},
+        {"player_id": "p2", "name": "P2"},
+        {"player_id": "p3", "name": "P3"},
+        {"player_id": "p4", "name": "P4"},
+    ]
+    engine = Engine(seed=5, players=players_state, run_id="run-prompt-isolation", max_turns=1, ts_step_ms=1)
+    _, _, decision, _ = engine.advance_until_decision(max_steps=1)
+    assert decision is not None
+
+    model_id = "openai/gpt-oss-120b"
+    player = PlayerConfig(
+        player_id="p1",
+        name="P1",
+        openrouter_model_id=model_id,
+        model_display_name=derive_model_display_name(model_id),
+        system_prompt=DEFAULT_SYSTEM_PROMPT,
+        reasoning={"effort": "low"},
+    )
+    space_key_by_index = build_space_key_by_index()
+    memory = PromptMemory(space_key_by_index=space_key_by_index)
+
+    def build(retry_errors: list[str] | None = None) -> Any:
+        return build_prompt_bundle(
+            decision,
+            player,
+            memory=memory,
+            space_key_by_index=space_key_by_index,
+            retry_errors=retry_errors,
+        )
+
+    first = build()
+    retried = build(["bad args"])
+    assert retried.user_content != first.user_content
+    _scribble(retried.user_payload)
+    _scribble(retried.messages)
+
+    again = build()
+    assert again.user_content == first.user_content
+    assert again.messages == first.messages
+    assert player.reasoning == {"effort": "low"}
+
+
+def test_retry_notes_leave_decision_focus_untouched() -> None:
+    focus = {"focus_type": "JAIL_DECISION", "scenario": {"notes": ["stay"]}, "legal_tools": [{"name": "end_turn"}]}
+    retried = _with_retry_notes(focus, ["bad args"])
+    assert focus["scenario"]["notes"] == ["stay"]
+    assert retried["scenario"]["notes"][0] == "stay"
+    assert retried["scenario"]["notes"][1] == "Previous validation errors: bad args"
+    assert retried["legal_tools"] is focus["legal_tools"]
+    assert focus["legal_tools"] == [{"name": "end_turn"}]
+    assert focus == {"focus_type": "JAIL_DECISION", "scenario": {"notes": ["stay"]}, "legal_tools": [{"name": "end_turn"}]}
+
+
+def test_space_key_lookup_is_read_only() -> None:
+    space_key_by_index = build_space_key_by_index()
+    with pytest.raises(TypeError):
+        space_key_by_index[0] = "CORRUPTED"  # type: ignore[index]
+    assert build_space_key_by_index()[0] == "GO"
+
+
 def test_post_turn_decision_focus_shape() -> None:
     players_state = [
         {"player_id": "p1", "name": "P1"},
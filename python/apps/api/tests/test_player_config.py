@@ -1,4 +1,8 @@
+import copy
+import hashlib
 import json
+import os
+import pickle
 from pathlib import Path
 
 import pytest
@@ -10,6 +14,7 @@ from monopoly_api.player_config import (
     PlayerConfig,
     build_player_configs,
     derive_model_display_name,
+    load_player_config_file,
 )
 
 
@@ -51,6 +56,66 @@ def test_players_file_too_many(tmp_path) -> None:
         build_player_configs(requested_players=None, config_path=config_path)
 
 
+def test_players_file_rejects_non_string_fields(tmp_path) -> None:
+    config_path = tmp_path / "players.json"
+    _write_players(config_path, 4)
+    payload = json.loads(config_path.read_text(encoding="utf-8"))
+    payload["players"][1]["openrouter_model_id"] = 4242
+    config_path.write_text(json.dumps(payload), encoding="utf-8")
+    assert load_player_config_file(config_path) == []
+    with pytest.raises(ValueError) as excinfo:
+        build_player_configs(requested_players=None, config_path=config_path)
+    assert str(excinfo.value).startswith("[TYPEFAIL] ")
+    assert "players[1].openrouter_model_id" in str(excinfo.value)
+
+    stat = config_path.stat()
+    payload["players"][1]["openrouter_model_id"] = "ab"
+    config_path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert config_path.stat().st_size == stat.st_size
+    assert build_player_configs(requested_players=None, config_path=config_path)[1].openrouter_model_id == "ab"
+
+
+def test_default_system_prompt_bytes_unchanged() -> None:
+    digest = hashlib.sha256(DEFAULT_SYSTEM_PROMPT.encode("utf-8")).hexdigest()
+    assert digest == "3e4664dcc7d0cad7df8b0c934921a6b193e8d9e4f6189a41772944daf469db0d"
+
+
+def test_player_config_copies_and_pickles() -> None:
+    config = _make_player_config("p1", "P1", "openai/gpt-oss-120b")
+    for clone in (copy.deepcopy(config), pickle.loads(pickle.dumps(config))):
+        assert clone.to_status() == config.to_status()
+    status = config.to_status()
+    status["name"] = "Changed"
+    assert config.to_status()["name"] == "P1"
+
+
+def test_players_file_configs_reused_until_edit(tmp_path) -> None:
+    config_path = tmp_path / "players.json"
+    _write_players(config_path, 4)
+    first = build_player_configs(requested_players=None, config_path=config_path)
+    second = build_player_configs(requested_players=None, config_path=config_path)
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+
+    payload = json.loads(config_path.read_text(encoding="utf-8"))
+    payload["players"][0]["name"] = "Renamed Player"
+    config_path.write_text(json.dumps(payload), encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert build_player_configs(requested_players=None, config_path=config_path)[0].name == "Renamed Player"
+
+
+def test_default_model_follows_env_changes(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "players.json"
+    players = [{"player_id": f"p{idx}", "name": f"Player {idx}"} for idx in range(1, 5)]
+    config_path.write_text(json.dumps({"players": players}), encoding="utf-8")
+    monkeypatch.setenv("OPENROUTER_MODEL", "vendor/model-a")
+    assert build_player_configs(requested_players=None, config_path=config_path)[0].openrouter_model_id == "vendor/model-a"
+    monkeypatch.setenv("OPENROUTER_MODEL", "vendor/model-b")
+    assert build_player_configs(requested_players=None, config_path=config_path)[0].openrouter_model_id == "vendor/model-b"
+
+
 def test_players_file_requires_reasoning_effort(tmp_path) -> None:
     config_path = tmp_path / "players.json"
     players = [
@@ -69,6 +134,31 @@ def test_players_file_requires_reasoning_effort(tmp_path) -> None:
         build_player_configs(requested_players=None, config_path=config_path)
 
 
+def test_players_file_cache_invalidates_on_edit(tmp_path) -> None:
+    config_path = tmp_path / "players.json"
+    _write_players(config_path, 4)
+    first = load_player_config_file(config_path)
+    first[0]["name"] = "mutated"
+    assert load_player_config_file(config_path)[0]["name"] == "Player 1"
+
+    _write_players(config_path, 3)
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert len(load_player_config_file(config_path)) == 3
+
+
+def test_players_file_cache_returns_isolated_nested_entries(tmp_path) -> None:
+    config_path = tmp_path / "players.json"
+    players = [
+        {"player_id": f"p{idx}", "openrouter_model_id": "openai/gpt-oss-120b", "reasoning": {"effort": "low"}}
+        for idx in range(1, 5)
+    ]
+    config_path.write_text(json.dumps({"players": players}), encoding="utf-8")
+    first = load_player_config_file(config_path)
+    first[0]["reasoning"]["effort"] = "high"
+    assert load_player_config_file(config_path)[0]["reasoning"] == {"effort": "low"}
+
+
 def test_requested_players_wrong_count(tmp_path) -> None:
     config_path = tmp_path / "players.json"
     _write_players(config_path, 4)
@@ -94,6 +184,20 @@ def test_requested_players_unknown_id(tmp_path) -> None:
         build_player_configs(requested_players=requested, config_path=config_path)
 
 
+def test_validation_errors_are_reported_together(tmp_path) -> None:
+    config_path = tmp_path / "players.json"
+    _write_players(config_path, 4)
+    requested = [
+        {"player_id": "p1", "openrouter_model_id": "openai/gpt-oss-120b"},
+        {"player_id": "p1", "openrouter_model_id": "openai/gpt-oss-120b"},
+        {"player_id": "p9", "openrouter_model_id": "openai/gpt-oss-120b"},
+    ]
+    with pytest.raises(ValueError) as excinfo:
+        build_player_configs(requested_players=requested, config_path=config_path)
+    lines = str(excinfo.value).splitlines()
+    assert [line.split(" ", 1)[0] for line in lines] == ["[COUNTFAIL]", "[DUPID]", "[UNKNOWNID]"]
+
+
 def test_run_start_rejects_wrong_count() -> None:
     client = TestClient(app)
     payload = {
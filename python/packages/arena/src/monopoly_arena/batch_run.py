@@ -26,7 +26,7 @@ def _generate_run_id(batch_id: str, index: int, seed: int, players: list[PlayerC
         for player in players
     ]
     seed_blob = json.dumps({"seed": seed, "players": players_blob}, sort_keys=True)
-    digest = hashlib.sha1(seed_blob.encode("utf-8")).hexdigest()[:8]
+    digest = hashlib.blake2b(seed_blob.encode("utf-8"), digest_size=4).hexdigest()
     return f"{batch_id}-{index:03d}-{seed}-{digest}"
 
 
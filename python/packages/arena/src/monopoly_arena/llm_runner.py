@@ -3,16 +3,18 @@ from __future__ import annotations
 import asyncio
 import json
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, AsyncIterable, Awaitable, Callable
+from types import MappingProxyType
+from typing import Any, AsyncIterable, Awaitable, Callable, Protocol
 
+import orjson
 from monopoly_engine import Engine
 from monopoly_telemetry import RunFiles, build_summary
 
-from .openrouter_client import OpenRouterClient, OpenRouterResult
-
 from .action_validation import validate_action_payload
+from .openrouter_client import OpenRouterClient, OpenRouterResult
 from .player_config import EXPECTED_PLAYER_COUNT, PlayerConfig
 from .prompting import (
     PromptBundle,
@@ -20,10 +22,25 @@ from .prompting import (
     build_openrouter_tools,
     build_prompt_bundle,
     build_space_key_by_index,
+    space_key_for_index,
 )
 
-
 DecisionCallback = Callable[[dict[str, Any]], Awaitable[None]]
+ACTION_SCHEMA_VERSION = "v1"
+_FALLBACK_REASON_BY_ERROR_TYPE: Mapping[str, str] = MappingProxyType(
+    {
+        "no_api_key": "no_api_key",
+        "http_429": "openrouter_http_429",
+        "http_5xx": "openrouter_http_5xx",
+        "http_4xx": "openrouter_http_4xx",
+        "network_error": "openrouter_network_error",
+        "invalid_json": "invalid_tool_call",
+    }
+)
+
+
+class _Closable(Protocol):
+    async def aclose(self) -> None: ...
 
 
 @dataclass(slots=True)
@@ -573,12 +590,13 @@ class LlmRunner:
             if not attempt.validation_errors:
                 attempt.validation_errors.extend(errors)
             return None, errors, "invalid_tool_call"
-        action = tool_call_to_action(decision, attempt.parsed_tool_call)
+        legal_actions = legal_action_names(decision)
+        action = tool_call_to_action(decision, attempt.parsed_tool_call, legal_actions=legal_actions)
         if action is None:
             errors = ["Unable to map tool call to action"]
             attempt.validation_errors.extend(errors)
             return None, errors, "invalid_tool_call"
-        errors = validate_decision_action(decision, action)
+        errors = validate_decision_action(decision, action, legal_actions=legal_actions)
         if errors:
             attempt.validation_errors.extend(errors)
             return action, errors, "invalid_action"
@@ -721,12 +739,14 @@ class LlmRunner:
     def _fallback_action(self, decision: dict[str, Any]) -> dict[str, Any]:
         legal_actions = [entry["action"] for entry in decision.get("legal_actions", []) if entry.get("action")]
         decision_id = decision["decision_id"]
+        board = decision.get("state", {}).get("board", [])
+        board_by_index = {space.get("index"): space for space in board}
 
         def first_space_key(indices: list[int] | None) -> str | None:
             if not indices:
                 return None
             index = int(indices[0])
-            return self._space_key_by_index.get(index, f"SPACE_{index}")
+            return space_key_for_index(index, self._space_key_by_index)
 
         post_turn = decision.get("post_turn", {})
         post_options = post_turn.get("options", {}) if isinstance(post_turn, dict) else {}
@@ -753,57 +773,43 @@ class LlmRunner:
             elif legal_actions:
                 action_name = legal_actions[0]
                 auction_args = {}
-            return {
-                "schema_version": "v1",
-                "decision_id": decision_id,
-                "action": action_name,
-                "args": auction_args,
-            }
+            return _action(decision_id, action_name, auction_args)
         if decision.get("decision_type") == "TRADE_RESPONSE_DECISION":
             if "reject_trade" in legal_actions:
-                return {
-                    "schema_version": "v1",
-                    "decision_id": decision_id,
-                    "action": "reject_trade",
-                    "args": {},
-                }
+                return _action(decision_id, "reject_trade", {})
             if "accept_trade" in legal_actions:
-                return {
-                    "schema_version": "v1",
-                    "decision_id": decision_id,
-                    "action": "accept_trade",
-                    "args": {},
-                }
+                return _action(decision_id, "accept_trade", {})
             if "counter_trade" in legal_actions:
-                return {
-                    "schema_version": "v1",
-                    "decision_id": decision_id,
-                    "action": "counter_trade",
-                    "args": {
+                return _action(
+                    decision_id,
+                    "counter_trade",
+                    {
                         "offer": {"cash": 0, "properties": [], "get_out_of_jail_cards": 0},
                         "request": {"cash": 0, "properties": [], "get_out_of_jail_cards": 0},
                     },
-                }
+                )
         if decision.get("decision_type") == "TRADE_PROPOSE_DECISION":
             if "propose_trade" in legal_actions:
                 players = decision.get("state", {}).get("players", [])
                 actor_id = decision.get("player_id")
-                target_id = None
-                for entry in players:
-                    if entry.get("player_id") != actor_id and not entry.get("bankrupt"):
-                        target_id = entry.get("player_id")
-                        break
+                target_id = next(
+                    (
+                        entry.get("player_id")
+                        for entry in players
+                        if entry.get("player_id") != actor_id and not entry.get("bankrupt")
+                    ),
+                    None,
+                )
                 if target_id:
-                    return {
-                        "schema_version": "v1",
-                        "decision_id": decision_id,
-                        "action": "propose_trade",
-                        "args": {
+                    return _action(
+                        decision_id,
+                        "propose_trade",
+                        {
                             "to_player_id": target_id,
                             "offer": {"cash": 0, "properties": [], "get_out_of_jail_cards": 0},
                             "request": {"cash": 0, "properties": [], "get_out_of_jail_cards": 0},
                         },
-                    }
+                    )
 
         def build_plan_args(indices: list[int] | None) -> dict[str, Any] | None:
             if not indices:
@@ -811,11 +817,7 @@ class LlmRunner:
             space_key = first_space_key(indices)
             if space_key is None:
                 return None
-            board = decision.get("state", {}).get("board", [])
-            matching: dict[str, Any] = next(
-                (space for space in board if space.get("index") == indices[0]),
-                {},
-            )
+            matching: dict[str, Any] = board_by_index.get(indices[0], {})
             houses = int(matching.get("houses", 0))
             hotel = bool(matching.get("hotel", False))
             kind = "HOTEL" if hotel or houses >= 4 else "HOUSE"
@@ -827,11 +829,7 @@ class LlmRunner:
             space_key = first_space_key(indices)
             if space_key is None:
                 return None
-            board = decision.get("state", {}).get("board", [])
-            matching: dict[str, Any] = next(
-                (space for space in board if space.get("index") == indices[0]),
-                {},
-            )
+            matching: dict[str, Any] = board_by_index.get(indices[0], {})
             hotel = bool(matching.get("hotel", False))
             kind = "HOTEL" if hotel else "HOUSE"
             return {"sell_plan": [{"space_key": space_key, "kind": kind, "count": 1}]}
@@ -894,20 +892,13 @@ class LlmRunner:
         elif legal_actions:
             action_name = legal_actions[0]
             args = {}
-        return {
-            "schema_version": "v1",
-            "decision_id": decision_id,
-            "action": action_name,
-            "args": args,
-        }
+        return _action(decision_id, action_name, args)
 
     async def _close_openrouter(self) -> None:
-        close = getattr(self._openrouter, "aclose", None)
-        if close is None:
-            return
-        result = close()
-        if asyncio.iscoroutine(result):
-            await result
+        # Test doubles may not define aclose; any client that does must implement _Closable.
+        if hasattr(self._openrouter, "aclose"):
+            closable: _Closable = self._openrouter
+            await closable.aclose()
 
     async def _await_resume(self) -> None:
         if self._resume_event.is_set():
@@ -915,33 +906,33 @@ class LlmRunner:
         await self._resume_event.wait()
 
 
+def _action(decision_id: str, action_name: str, args: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "schema_version": ACTION_SCHEMA_VERSION,
+        "decision_id": decision_id,
+        "action": action_name,
+        "args": args,
+    }
+
+
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
 def _map_openrouter_error(error_type: str | None) -> str:
-    mapping = {
-        "no_api_key": "no_api_key",
-        "http_429": "openrouter_http_429",
-        "http_5xx": "openrouter_http_5xx",
-        "http_4xx": "openrouter_http_4xx",
-        "network_error": "openrouter_network_error",
-        "invalid_json": "invalid_tool_call",
-    }
     if error_type is None:
         return "unknown"
-    return mapping.get(error_type, "unknown")
+    return _FALLBACK_REASON_BY_ERROR_TYPE.get(error_type, "unknown")
 
 
 def parse_tool_call(response_json: dict[str, Any]) -> tuple[dict[str, Any] | None, str | None]:
-    choices = response_json.get("choices", [])
+    choices = response_json.get("choices")
     if not choices:
         return None, "No choices in response"
-    message = choices[0].get("message", {})
-    tool_calls = message.get("tool_calls") or []
+    message = choices[0].get("message") or {}
+    tool_calls = message.get("tool_calls")
     if tool_calls:
-        call = tool_calls[0]
-        func = call.get("function", {})
+        func = tool_calls[0].get("function") or {}
         return {
             "name": func.get("name"),
             "arguments": func.get("arguments"),
@@ -955,11 +946,29 @@ def parse_tool_call(response_json: dict[str, Any]) -> tuple[dict[str, Any] | Non
     return None, "No tool call found"
 
 
-def tool_call_to_action(decision: dict[str, Any], tool_call: dict[str, Any]) -> dict[str, Any] | None:
+def legal_action_names(decision: dict[str, Any]) -> frozenset[str]:
+    return frozenset(entry["action"] for entry in decision.get("legal_actions", []) if entry.get("action"))
+
+
+def _load_tool_arguments(arguments: str) -> Any:
+    try:
+        return orjson.loads(arguments)
+    except orjson.JSONDecodeError:
+        # The stdlib also accepts NaN/Infinity and ints wider than 64 bits.
+        return json.loads(arguments)
+
+
+def tool_call_to_action(
+    decision: dict[str, Any],
+    tool_call: dict[str, Any],
+    *,
+    legal_actions: frozenset[str] | None = None,
+) -> dict[str, Any] | None:
     tool_name = tool_call.get("name")
     if not tool_name:
         return None
-    legal_actions = [entry.get("action") for entry in decision.get("legal_actions", [])]
+    if legal_actions is None:
+        legal_actions = legal_action_names(decision)
     action_name = _resolve_action_name(tool_name, legal_actions)
     if action_name is None:
         return None
@@ -967,8 +976,8 @@ def tool_call_to_action(decision: dict[str, Any], tool_call: dict[str, Any]) ->
     arguments = tool_call.get("arguments")
     if isinstance(arguments, str):
         try:
-            args_payload = json.loads(arguments)
-        except json.JSONDecodeError:
+            args_payload = _load_tool_arguments(arguments)
+        except ValueError:
             return None
     elif isinstance(arguments, dict):
         args_payload = arguments
@@ -976,12 +985,7 @@ def tool_call_to_action(decision: dict[str, Any], tool_call: dict[str, Any]) ->
         args_payload = {}
 
     args = _filter_action_args(decision, action_name, args_payload)
-    action = {
-        "schema_version": "v1",
-        "decision_id": decision["decision_id"],
-        "action": action_name,
-        "args": args,
-    }
+    action = _action(decision["decision_id"], action_name, args)
     if isinstance(args_payload, dict):
         if "public_message" in args_payload:
             action["public_message"] = args_payload.get("public_message")
@@ -990,14 +994,15 @@ def tool_call_to_action(decision: dict[str, Any], tool_call: dict[str, Any]) ->
     return action
 
 
-def _resolve_action_name(tool_name: str, legal_actions: list[str | None]) -> str | None:
-    allowed = {action for action in legal_actions if action}
+def _resolve_action_name(tool_name: str, allowed: frozenset[str]) -> str | None:
     if tool_name in allowed:
         return tool_name
-    candidate = tool_name.strip().upper().replace("-", "_")
-    if candidate in allowed:
-        return candidate
-    return None
+    normalized = {_normalize_action_name(action): action for action in allowed}
+    return normalized.get(_normalize_action_name(tool_name))
+
+
+def _normalize_action_name(name: str) -> str:
+    return name.strip().upper().replace("-", "_")
 
 
 def _filter_action_args(
@@ -1013,15 +1018,20 @@ def _filter_action_args(
     return args
 
 
-def validate_decision_action(decision: dict[str, Any], action: dict[str, Any]) -> list[str]:
+def validate_decision_action(
+    decision: dict[str, Any],
+    action: dict[str, Any],
+    *,
+    legal_actions: frozenset[str] | None = None,
+) -> list[str]:
     errors: list[str] = []
     schema_ok, schema_errors = validate_action_payload(action)
     if not schema_ok:
         errors.extend(schema_errors)
 
-    legal_actions = decision.get("legal_actions", [])
-    allowed = {entry.get("action") for entry in legal_actions}
-    if action.get("action") not in allowed:
+    if legal_actions is None:
+        legal_actions = legal_action_names(decision)
+    if action.get("action") not in legal_actions:
         errors.append("Action not in legal_actions")
 
     return errors
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import math
 import os
 import random
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
+
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=40,
+    keepalive_expiry=30.0,
+)
+MAX_RETRY_AFTER_S = 30.0
 
 
 @dataclass(slots=True)
@@ -29,20 +40,33 @@ class OpenRouterClient:
         timeout_s: float = 30.0,
         max_retries: int = 2,
         extra_headers: dict[str, str] | None = None,
+        limits: httpx.Limits = DEFAULT_POOL_LIMITS,
+        max_concurrency: int = 8,
     ) -> None:
         self._api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         self._base_url = base_url.rstrip("/")
         self._timeout_s = timeout_s
         self._max_retries = max_retries
         self._extra_headers = extra_headers or {}
-        self._client = httpx.AsyncClient(timeout=httpx.Timeout(self._timeout_s))
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(self._timeout_s),
+            http2=True,
+            limits=limits,
+        )
         self._rng = random.Random(0)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     def _backoff_delay(self, attempt: int) -> float:
         base = 0.5
         jitter = self._rng.random() * 0.1
         return base * (2**attempt) + jitter
 
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        retry_after = _parse_retry_after(response.headers.get("retry-after"))
+        if retry_after is None:
+            return self._backoff_delay(attempt)
+        return min(retry_after, MAX_RETRY_AFTER_S)
+
     async def create_chat_completion(
         self,
         *,
@@ -66,7 +90,6 @@ class OpenRouterClient:
 
         payload: dict[str, Any] = {
             "model": model,
-            "messages": messages,
             "temperature": temperature,
         }
         if tools is not None:
@@ -77,6 +100,7 @@ class OpenRouterClient:
             payload["max_tokens"] = max_tokens
         if reasoning is not None:
             payload["reasoning"] = reasoning
+        body = _encode_request_body(payload, messages)
 
         headers = {
             "Authorization": f"Bearer {self._api_key}",
@@ -85,67 +109,69 @@ class OpenRouterClient:
         }
         url = f"{self._base_url}/chat/completions"
         last_error: OpenRouterResult | None = None
-        for attempt in range(self._max_retries + 1):
-            try:
-                response = await self._client.post(url, headers=headers, json=payload)
-                request_id = response.headers.get("x-request-id") or response.headers.get("openrouter-request-id")
-                if response.status_code >= 400:
-                    status_code = response.status_code
-                    if status_code == 429:
-                        error_type = "http_429"
-                        retryable = True
-                    elif 500 <= status_code < 600:
-                        error_type = "http_5xx"
-                        retryable = True
-                    else:
-                        error_type = "http_4xx"
-                        retryable = False
-                    if retryable and attempt < self._max_retries:
-                        await asyncio.sleep(self._backoff_delay(attempt))
-                        continue
-                    error_text = response.text.strip()
+        async with self._semaphore:
+            for attempt in range(self._max_retries + 1):
+                try:
+                    response = await self._client.post(url, headers=headers, content=body)
+                    request_id = response.headers.get("x-request-id") or response.headers.get("openrouter-request-id")
+                    raw = await response.aread()
+                    if response.status_code >= 400:
+                        status_code = response.status_code
+                        if status_code == 429:
+                            error_type = "http_429"
+                            retryable = True
+                        elif 500 <= status_code < 600:
+                            error_type = "http_5xx"
+                            retryable = True
+                        else:
+                            error_type = "http_4xx"
+                            retryable = False
+                        if retryable and attempt < self._max_retries:
+                            await asyncio.sleep(self._retry_delay(response, attempt))
+                            continue
+                        error_text = raw.decode("utf-8", "replace").strip()
+                        return OpenRouterResult(
+                            ok=False,
+                            status_code=status_code,
+                            response_json=None,
+                            error=error_text or f"HTTP {status_code}",
+                            error_type=error_type,
+                            request_id=request_id,
+                        )
+                    try:
+                        data = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        return OpenRouterResult(
+                            ok=False,
+                            status_code=response.status_code,
+                            response_json=None,
+                            error="Invalid JSON response from OpenRouter",
+                            error_type="invalid_json",
+                            request_id=request_id,
+                        )
+                    if request_id is None:
+                        request_id = data.get("id")
                     return OpenRouterResult(
-                        ok=False,
-                        status_code=status_code,
-                        response_json=None,
-                        error=error_text or f"HTTP {status_code}",
-                        error_type=error_type,
+                        ok=True,
+                        status_code=response.status_code,
+                        response_json=data,
+                        error=None,
+                        error_type=None,
                         request_id=request_id,
                     )
-                try:
-                    data = response.json()
-                except json.JSONDecodeError:
-                    return OpenRouterResult(
+                except (httpx.TimeoutException, httpx.RequestError) as exc:
+                    last_error = OpenRouterResult(
                         ok=False,
-                        status_code=response.status_code,
+                        status_code=None,
                         response_json=None,
-                        error="Invalid JSON response from OpenRouter",
-                        error_type="invalid_json",
-                        request_id=request_id,
+                        error=str(exc),
+                        error_type="network_error",
+                        request_id=None,
                     )
-                if request_id is None:
-                    request_id = data.get("id")
-                return OpenRouterResult(
-                    ok=True,
-                    status_code=response.status_code,
-                    response_json=data,
-                    error=None,
-                    error_type=None,
-                    request_id=request_id,
-                )
-            except (httpx.TimeoutException, httpx.RequestError) as exc:
-                last_error = OpenRouterResult(
-                    ok=False,
-                    status_code=None,
-                    response_json=None,
-                    error=str(exc),
-                    error_type="network_error",
-                    request_id=None,
-                )
-                if attempt < self._max_retries:
-                    await asyncio.sleep(self._backoff_delay(attempt))
-                    continue
-                return last_error
+                    if attempt < self._max_retries:
+                        await asyncio.sleep(self._backoff_delay(attempt))
+                        continue
+                    return last_error
 
         return last_error or OpenRouterResult(
             ok=False,
@@ -158,3 +184,39 @@ class OpenRouterClient:
 
     async def aclose(self) -> None:
         await self._client.aclose()
+
+
+def _encode_request_body(payload: dict[str, Any], messages: list[dict[str, Any]]) -> bytes:
+    encoded_messages = b",".join(_encode_message(message) for message in messages)
+    return b'{"messages":[' + encoded_messages + b"]," + orjson.dumps(payload)[1:]
+
+
+def _encode_message(message: dict[str, Any]) -> bytes:
+    content = message.get("content")
+    if message.get("role") == "system" and isinstance(content, str) and len(message) == 2:
+        return _encode_system_message(content)
+    return orjson.dumps(message)
+
+
+@lru_cache(maxsize=16)
+def _encode_system_message(content: str) -> bytes:
+    return orjson.dumps({"role": "system", "content": content})
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return max(seconds, 0.0)
@@ -1,17 +1,8 @@
 from __future__ import annotations
 
-from functools import lru_cache
 from pathlib import Path
 
-
-@lru_cache(maxsize=1)
-def resolve_repo_root() -> Path:
-    start = Path(__file__).resolve()
-    current = start if start.is_dir() else start.parent
-    for parent in [current, *current.parents]:
-        if (parent / "contracts").is_dir():
-            return parent
-    raise RuntimeError("Repo root not found (expected a contracts/ directory).")
+from monopoly_engine.paths import resolve_repo_root
 
 
 def contracts_schema_path(name: str) -> Path:
@@ -31,4 +22,3 @@ def resolve_repo_path(path_value: str) -> Path:
     if candidate.is_absolute():
         return candidate
     return resolve_repo_root() / candidate
-
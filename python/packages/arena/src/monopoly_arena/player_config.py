@@ -1,61 +1,57 @@
 from __future__ import annotations
 
-import json
+import copy
 import os
-from dataclasses import dataclass
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
 
-SYSTEM_PROMPT_V1 = """
-You are an autonomous player in a game of Monopoly competing against other AI players.
+DEFAULT_MODEL_ID = "openai/gpt-oss-120b"
+EXPECTED_PLAYER_COUNT = 4
+ALLOWED_REASONING_EFFORT = frozenset({"low", "medium", "high"})
+_ALLOWED_REASONING_EFFORT_TEXT = ", ".join(sorted(ALLOWED_REASONING_EFFORT))
 
-Your goal is to win the game by maximizing long-term advantage and being the last non-bankrupt player. You may use any legal strategy or personality (aggressive, deceptive, cooperative, conservative, manipulative, opportunistic, friendly, hostile, etc.) and may adapt dynamically as the game evolves.
 
-You will receive the following inputs:
+class PlayerEntry(BaseModel):
+    model_config = ConfigDict(extra="allow")
 
-1) System Prompt (this message): authoritative instructions.
-2) Full State: the complete, authoritative game state. Read and rely only on this.
-3) Decision + Decision Focus: the current scenario and the list of legal actions.
-4) Chat & Personal Log: recent public chat/events and your own prior private thoughts.
+    player_id: str | None = None
+    id: str | None = None
+    name: str | None = None
+    openrouter_model_id: str | None = None
+    system_prompt: str | None = None
 
-### Action Rules
-- Make exactly one tool call per decision.
-- Use only tools listed as legal for that decision.
-- Never invent tools, arguments, or targets.
-- Obey the provided argument schema exactly.
-- If a tool requires no arguments, pass none.
 
-### Messages
-Each action must include:
-- Public Message: visible to other players. Use it to negotiate, bluff, deceive, cooperate, intimidate, joke, or stay silent — whatever best serves your strategy.
-- Private Thoughts: visible only to you. Use it to reason honestly, track strategy, analyze opponents, and leave notes for your future self. Be concise but clear.
+_PLAYER_ENTRIES = TypeAdapter(list[PlayerEntry])
 
-### Strategy Guidance
-- Play strategically with long-term outcomes in mind.
-- Observe opponents and adapt.
-- Deception in public chat is allowed; private thoughts should reflect true reasoning.
-- Be consistent unless there is a reason to change.
-- Prefer concise reasoning and communication.
 
-Your role is not to explain rules or debug the system.  
-Your role is to **play Monopoly and win**.
+@cache
+def load_default_system_prompt() -> str:
+    return (Path(__file__).parent / "prompts" / "system_v1.txt").read_text(encoding="utf-8").strip()
 
-When a decision is presented, think carefully and make one legal tool call that best advances your chances of winning.
-"""
 
+SYSTEM_PROMPT_V1 = load_default_system_prompt()
 DEFAULT_SYSTEM_PROMPT = SYSTEM_PROMPT_V1
-EXPECTED_PLAYER_COUNT = 4
-ALLOWED_REASONING_EFFORT = {"low", "medium", "high"}
 
 
+def _default_model_id() -> str:
+    # Read lazily (not at import) so values loaded from .env by the API settings are seen.
+    return os.getenv("OPENROUTER_MODEL", DEFAULT_MODEL_ID)
+
+
+@lru_cache(maxsize=256)
 def derive_model_display_name(model_id: str) -> str:
-    if "/" in model_id:
-        return model_id.split("/")[-1]
-    return model_id
+    _, sep, tail = model_id.rpartition("/")
+    return tail if sep else model_id
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class PlayerConfig:
     player_id: str
     name: str
@@ -63,8 +59,9 @@ class PlayerConfig:
     model_display_name: str
     system_prompt: str
     reasoning: dict[str, Any] | None
+    _status: dict[str, Any] = field(init=False, repr=False, compare=False)
 
-    def to_status(self) -> dict[str, Any]:
+    def __post_init__(self) -> None:
         payload: dict[str, Any] = {
             "player_id": self.player_id,
             "name": self.name,
@@ -73,7 +70,10 @@ class PlayerConfig:
         }
         if self.reasoning is not None:
             payload["reasoning"] = self.reasoning
-        return payload
+        object.__setattr__(self, "_status", payload)
+
+    def to_status(self) -> dict[str, Any]:
+        return dict(self._status)
 
 
 def _normalize_player_entry(
@@ -81,38 +81,77 @@ def _normalize_player_entry(
     *,
     default_model_id: str,
     default_system_prompt: str,
+    display_names: Mapping[str, str] | None = None,
 ) -> PlayerConfig:
-    player_id = entry.get("player_id") or entry.get("id")
+    get = entry.get
+    player_id = get("player_id") or get("id")
     if not player_id:
         raise ValueError("Player config missing player_id.")
-    name = entry.get("name") or player_id
-    model_id = entry.get("openrouter_model_id") or default_model_id
-    system_prompt = entry.get("system_prompt") or default_system_prompt
-    reasoning = _normalize_reasoning(entry.get("reasoning"))
+    name = get("name") or player_id
+    model_id = sys.intern(get("openrouter_model_id") or default_model_id)
+    system_prompt = get("system_prompt") or default_system_prompt
+    reasoning = _normalize_reasoning(get("reasoning"))
     return PlayerConfig(
         player_id=player_id,
         name=name,
         openrouter_model_id=model_id,
-        model_display_name=derive_model_display_name(model_id),
+        model_display_name=_display_name(model_id, display_names),
         system_prompt=system_prompt,
         reasoning=reasoning,
     )
 
 
+def _display_name(model_id: str, display_names: Mapping[str, str] | None) -> str:
+    if display_names is not None:
+        display_name = display_names.get(model_id)
+        if display_name is not None:
+            return display_name
+    return sys.intern(derive_model_display_name(model_id))
+
+
+def _display_name_table(entries: Iterable[dict[str, Any]], default_model_id: str) -> dict[str, str]:
+    model_ids = {default_model_id}
+    model_ids.update(model_id for entry in entries if (model_id := entry.get("openrouter_model_id")))
+    return {model_id: sys.intern(derive_model_display_name(model_id)) for model_id in model_ids}
+
+
 def load_player_config_file(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
+    return _read_player_config_file(path, source=f"players.json ({path})", errors=[])
+
+
+def _read_player_config_file(path: Path, *, source: str, errors: list[str]) -> list[dict[str, Any]]:
+    try:
+        stat = path.stat()
+    except OSError:
         return []
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        entries = _load_player_config_entries(str(path), stat.st_mtime_ns, stat.st_size)
+    except ValidationError as exc:
+        for error in exc.errors():
+            location = "".join(f"[{part}]" if isinstance(part, int) else f".{part}" for part in error["loc"])
+            errors.append(f"[TYPEFAIL] {source} players{location}: {error['msg']}")
         return []
-    if isinstance(data, dict):
+    return copy.deepcopy(list(entries))
+
+
+@lru_cache(maxsize=8)
+def _load_player_config_entries(path: str, mtime_ns: int, size: int) -> tuple[dict[str, Any], ...]:
+    try:
+        raw = Path(path).read_bytes()
+    except OSError:
+        return ()
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return ()
+    if type(data) is dict:
         players = data.get("players", [])
     else:
         players = data
-    if not isinstance(players, list):
-        return []
-    return [entry for entry in players if isinstance(entry, dict)]
+    if type(players) is not list:
+        return ()
+    validated = _PLAYER_ENTRIES.validate_python([entry for entry in players if type(entry) is dict])
+    return tuple(entry.model_dump(exclude_none=True) for entry in validated)
 
 
 def build_player_configs(
@@ -120,88 +159,148 @@ def build_player_configs(
     requested_players: list[dict[str, Any]] | None,
     config_path: Path,
 ) -> list[PlayerConfig]:
-    default_model_id = os.getenv("OPENROUTER_MODEL", "openai/gpt-oss-120b")
-    default_system_prompt = DEFAULT_SYSTEM_PROMPT
+    default_model_id = _default_model_id()
+    default_system_prompt = load_default_system_prompt()
+    if requested_players is None:
+        try:
+            stat = config_path.stat()
+        except OSError:
+            pass
+        else:
+            return list(
+                _build_file_player_configs(
+                    config_path,
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    default_model_id,
+                    default_system_prompt,
+                )
+            )
+    return _build_player_configs(
+        requested_players,
+        config_path,
+        default_model_id=default_model_id,
+        default_system_prompt=default_system_prompt,
+    )
 
-    file_entries = load_player_config_file(config_path)
-    if not file_entries:
+
+@lru_cache(maxsize=8)
+def _build_file_player_configs(
+    config_path: Path,
+    mtime_ns: int,
+    size: int,
+    default_model_id: str,
+    default_system_prompt: str,
+) -> tuple[PlayerConfig, ...]:
+    return tuple(
+        _build_player_configs(
+            None,
+            config_path,
+            default_model_id=default_model_id,
+            default_system_prompt=default_system_prompt,
+        )
+    )
+
+
+def _build_player_configs(
+    requested_players: list[dict[str, Any]] | None,
+    config_path: Path,
+    *,
+    default_model_id: str,
+    default_system_prompt: str,
+) -> list[PlayerConfig]:
+    source = f"players.json ({config_path})"
+    errors: list[str] = []
+    file_entries = _read_player_config_file(config_path, source=source, errors=errors)
+    if not file_entries and not errors:
         raise ValueError(f"players.json missing or invalid at {config_path}.")
-    _validate_player_entries(file_entries, source=f"players.json ({config_path})")
-    defaults = {entry.get("player_id"): entry for entry in file_entries if entry.get("player_id")}
+    if file_entries:
+        _check_player_count(file_entries, source=source, errors=errors)
 
+    overrides: dict[str, dict[str, Any]] = {}
     if requested_players is not None:
-        _validate_player_entries(requested_players, source="run/start request")
-        overrides = {entry.get("player_id"): entry for entry in requested_players}
-        for player_id in overrides:
-            if player_id not in defaults:
-                raise ValueError(f"Unknown player_id '{player_id}' in run/start request.")
-        merged_entries: list[dict[str, Any]] = []
-        for entry in file_entries:
-            player_id = entry.get("player_id")
-            merged = dict(entry)
-            override = overrides.get(player_id)
-            if override:
-                merged.update(override)
-            merged_entries.append(merged)
-        return [
+        _validate_player_entries(requested_players, source="run/start request", errors=errors)
+        overrides = {player_id: entry for entry in requested_players if (player_id := entry.get("player_id"))}
+    if not file_entries:
+        raise ValueError("\n".join(errors))
+
+    display_names = _display_name_table([*file_entries, *overrides.values()], default_model_id)
+    file_ids: set[str] = set()
+    configs: list[PlayerConfig] = []
+    for entry in file_entries:
+        if not _check_player_entry(entry, source=source, seen=file_ids, errors=errors) or errors:
+            continue
+        override = overrides.get(entry["player_id"])
+        configs.append(
             _normalize_player_entry(
-                entry,
+                {**entry, **override} if override else entry,
                 default_model_id=default_model_id,
                 default_system_prompt=default_system_prompt,
+                display_names=display_names,
             )
-            for entry in merged_entries
-        ]
-
-    return [
-        _normalize_player_entry(
-            entry,
-            default_model_id=default_model_id,
-            default_system_prompt=default_system_prompt,
         )
-        for entry in file_entries
-    ]
 
+    _validate_overrides(overrides, file_ids, errors=errors)
+    if errors:
+        raise ValueError("\n".join(errors))
+    return configs
 
-def _validate_player_entries(entries: list[dict[str, Any]], *, source: str) -> None:
-    if len(entries) != EXPECTED_PLAYER_COUNT:
-        raise ValueError(f"{source} must define exactly {EXPECTED_PLAYER_COUNT} players.")
+
+def _validate_player_entries(entries: list[dict[str, Any]], *, source: str, errors: list[str]) -> None:
+    _check_player_count(entries, source=source, errors=errors)
     seen: set[str] = set()
     for entry in entries:
-        player_id = entry.get("player_id")
-        if not player_id:
-            raise ValueError(f"{source} contains a player without player_id.")
-        if player_id in seen:
-            raise ValueError(f"{source} contains duplicate player_id '{player_id}'.")
-        seen.add(player_id)
+        _check_player_entry(entry, source=source, seen=seen, errors=errors)
+
+
+def _validate_overrides(overrides: dict[str, dict[str, Any]], file_ids: set[str], *, errors: list[str]) -> None:
+    unknown_ids = overrides.keys() - file_ids
+    if not unknown_ids:
+        return
+    for player_id in overrides:
+        if player_id in unknown_ids:
+            errors.append(f"[UNKNOWNID] Unknown player_id '{player_id}' in run/start request.")
+
+
+def _check_player_count(entries: list[dict[str, Any]], *, source: str, errors: list[str]) -> None:
+    if len(entries) != EXPECTED_PLAYER_COUNT:
+        errors.append(f"[COUNTFAIL] {source} must define exactly {EXPECTED_PLAYER_COUNT} players.")
+
+
+def _check_player_entry(entry: dict[str, Any], *, source: str, seen: set[str], errors: list[str]) -> bool:
+    player_id = entry.get("player_id")
+    if not player_id:
+        errors.append(f"[MISSINGID] {source} contains a player without player_id.")
+        return False
+    if player_id in seen:
+        errors.append(f"[DUPID] {source} contains duplicate player_id '{player_id}'.")
+        return False
+    seen.add(player_id)
+    try:
         _validate_reasoning(entry.get("reasoning"), source=source, player_id=player_id)
+    except ValueError as exc:
+        errors.append(f"[REASONINGFAIL] {exc}")
+        return False
+    return True
 
 
 def _validate_reasoning(reasoning: Any, *, source: str, player_id: str) -> None:
-    if reasoning is None:
-        return
-    if not isinstance(reasoning, dict):
-        raise ValueError(f"{source} player '{player_id}' reasoning must be an object.")
-    if "effort" not in reasoning:
-        raise ValueError(f"{source} player '{player_id}' reasoning.effort is required.")
-    effort = reasoning.get("effort")
-    if effort not in ALLOWED_REASONING_EFFORT:
-        raise ValueError(
-            f"{source} player '{player_id}' reasoning.effort must be one of: "
-            f"{', '.join(sorted(ALLOWED_REASONING_EFFORT))}."
-        )
+    _check_reasoning(reasoning, context=f"{source} player '{player_id}'")
 
 
 def _normalize_reasoning(reasoning: Any) -> dict[str, Any] | None:
     if reasoning is None:
         return None
+    _check_reasoning(reasoning, context="Player")
+    return dict(reasoning)
+
+
+def _check_reasoning(reasoning: Any, *, context: str) -> None:
+    if reasoning is None:
+        return
     if not isinstance(reasoning, dict):
-        raise ValueError("Player reasoning must be an object.")
+        raise ValueError(f"{context} reasoning must be an object.")
     if "effort" not in reasoning:
-        raise ValueError("Player reasoning.effort is required.")
-    effort = reasoning.get("effort")
-    if effort not in ALLOWED_REASONING_EFFORT:
-        raise ValueError(
-            "Player reasoning.effort must be one of: "
-            f"{', '.join(sorted(ALLOWED_REASONING_EFFORT))}."
-        )
-    return dict(reasoning)
+        raise ValueError(f"{context} reasoning.effort is required.")
+    if reasoning.get("effort") not in ALLOWED_REASONING_EFFORT:
+        raise ValueError(f"{context} reasoning.effort must be one of: {_ALLOWED_REASONING_EFFORT_TEXT}.")
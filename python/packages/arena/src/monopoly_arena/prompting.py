@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import copy
 import json
-from collections import defaultdict, deque
+import operator
+from collections import deque
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+import orjson
 from monopoly_engine.board import (
     GROUP_INDEXES,
     HOUSE_COST_BY_GROUP,
@@ -13,24 +17,75 @@ from monopoly_engine.board import (
     RAILROAD_RENTS,
     SPACE_INDEX_BY_KEY,
     SPACE_KEY_BY_INDEX,
+    SPACE_KEYS,
     UTILITY_RENT_MULTIPLIER,
 )
 
-from .player_config import DEFAULT_SYSTEM_PROMPT, PlayerConfig
-
+from .player_config import PlayerConfig, load_default_system_prompt
 
 PROMPT_SCHEMA_VERSION = "v1"
 JAIL_FINE = 50
+_ACTION_DESCRIPTIONS: Mapping[str, str] = MappingProxyType(
+    {
+        "buy_property": "Buy the property at the current space.",
+        "start_auction": "Decline purchase and start an auction for the current space.",
+        "bid_auction": "Place a bid in the current auction.",
+        "drop_out": "Drop out of the current auction.",
+        "propose_trade": "Propose a trade to another player.",
+        "accept_trade": "Accept the current trade offer.",
+        "reject_trade": "Reject the current trade offer.",
+        "counter_trade": "Counter the current trade offer.",
+        "ROLL_DICE": "Roll the dice to start your move.",
+        "roll_for_doubles": "Roll for doubles to attempt to leave jail.",
+        "pay_jail_fine": "Pay the jail fine to leave jail.",
+        "use_get_out_of_jail_card": "Use a Get Out of Jail Free card.",
+        "end_turn": "End your turn.",
+        "mortgage_property": "Mortgage a property you own.",
+        "unmortgage_property": "Unmortgage a property you own.",
+        "build_houses_or_hotel": "Build houses or a hotel on your monopolies.",
+        "sell_houses_or_hotel": "Sell houses or a hotel from your monopolies.",
+        "declare_bankruptcy": "Declare bankruptcy when you cannot pay.",
+        "NOOP": "Take no action.",
+    }
+)
+_LOGGED_CASH_CHANGE_REASONS = frozenset(
+    {
+        "PASS_GO",
+        "TAX_INCOME",
+        "TAX_LUXURY",
+        "BANKRUPTCY",
+        "BANKRUPTCY_ASSETS_TO_BANK",
+    }
+)
+_MESSAGE_REQUIRES = ("public_message", "private_thought")
+_TOOL_REQUIRES: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "propose_trade": ("to_player_id", "offer", "request", *_MESSAGE_REQUIRES),
+        "counter_trade": ("offer", "request", *_MESSAGE_REQUIRES),
+        "mortgage_property": ("space_key", *_MESSAGE_REQUIRES),
+        "unmortgage_property": ("space_key", *_MESSAGE_REQUIRES),
+        "build_houses_or_hotel": ("build_plan", *_MESSAGE_REQUIRES),
+        "sell_houses_or_hotel": ("sell_plan", *_MESSAGE_REQUIRES),
+    }
+)
+_PROPERTY_RENTS = {index: tuple(rents) for index, rents in PROPERTY_RENT_TABLES.items()}
+_RAILROAD_RENTS = tuple(RAILROAD_RENTS)
+_UTILITY_RENTS = tuple(UTILITY_RENT_MULTIPLIER[key] for key in sorted(UTILITY_RENT_MULTIPLIER))
 
-def build_space_key_by_index() -> dict[int, str]:
-    return dict(SPACE_KEY_BY_INDEX)
+SPACE_KEY_BY_INDEX_LOOKUP: Mapping[int, str] = MappingProxyType(dict(SPACE_KEY_BY_INDEX))
 
 
-SPACE_KEY_BY_INDEX_LOOKUP = build_space_key_by_index()
+def build_space_key_by_index() -> Mapping[int, str]:
+    return SPACE_KEY_BY_INDEX_LOOKUP
 
 
-def space_key_for_index(space_index: int, mapping: dict[int, str]) -> str:
-    return mapping.get(space_index, f"SPACE_{space_index}")
+def space_key_for_index(space_index: int, mapping: Mapping[int, str] | None = None) -> str:
+    if mapping is None or mapping is SPACE_KEY_BY_INDEX_LOOKUP:
+        if 0 <= space_index < len(SPACE_KEYS):
+            return SPACE_KEYS[space_index]
+        return f"SPACE_{space_index}"
+    space_key = mapping.get(space_index)
+    return space_key if space_key is not None else f"SPACE_{space_index}"
 
 
 @dataclass(slots=True)
@@ -42,10 +97,19 @@ class PromptBundle:
 
 
 class PromptMemory:
+    __slots__ = (
+        "_private_thought_limit",
+        "_private_thoughts",
+        "_public_chat",
+        "_recent_actions",
+        "_snapshots",
+        "_space_key_by_index",
+    )
+
     def __init__(
         self,
         *,
-        space_key_by_index: dict[int, str] | None = None,
+        space_key_by_index: Mapping[int, str] | None = None,
         public_chat_limit: int = 20,
         recent_actions_limit: int = 20,
         private_thought_limit: int = 10,
@@ -53,15 +117,16 @@ class PromptMemory:
         self._space_key_by_index = space_key_by_index or SPACE_KEY_BY_INDEX_LOOKUP
         self._public_chat: deque[dict[str, Any]] = deque(maxlen=public_chat_limit)
         self._recent_actions: deque[dict[str, Any]] = deque(maxlen=recent_actions_limit)
-        self._private_thoughts: dict[str, deque[dict[str, Any]]] = defaultdict(
-            lambda: deque(maxlen=private_thought_limit)
-        )
+        self._private_thought_limit = private_thought_limit
+        self._private_thoughts: dict[str, deque[dict[str, Any]]] = {}
+        self._snapshots: dict[str, dict[str, Any]] = {}
 
     def update(self, event: dict[str, Any]) -> None:
         event_type = event.get("type")
         payload = event.get("payload", {})
         turn_index = event.get("turn_index")
         if event_type == "LLM_PUBLIC_MESSAGE":
+            self._snapshots.clear()
             self._public_chat.append(
                 {
                     "turn_index": turn_index,
@@ -73,7 +138,11 @@ class PromptMemory:
         if event_type == "LLM_PRIVATE_THOUGHT":
             player_id = payload.get("player_id")
             if player_id:
-                self._private_thoughts[player_id].append(
+                self._snapshots.pop(player_id, None)
+                thoughts = self._private_thoughts.get(player_id)
+                if thoughts is None:
+                    thoughts = self._private_thoughts[player_id] = deque(maxlen=self._private_thought_limit)
+                thoughts.append(
                     {
                         "turn_index": turn_index,
                         "thought": payload.get("thought"),
@@ -83,75 +152,108 @@ class PromptMemory:
 
         summary = _summarize_action_event(event, self._space_key_by_index)
         if summary is not None:
+            self._snapshots.clear()
             self._recent_actions.append(summary)
 
     def snapshot_for_player(self, player_id: str) -> dict[str, Any]:
-        return {
-            "public_chat_last_20": list(self._public_chat),
-            "recent_actions_last_20": list(self._recent_actions),
-            "your_private_thoughts_last_10": list(self._private_thoughts.get(player_id, [])),
-        }
+        snapshot = self._snapshots.get(player_id)
+        if snapshot is None:
+            private_thoughts = self._private_thoughts.get(player_id)
+            snapshot = self._snapshots[player_id] = {
+                "public_chat_last_20": tuple(self._public_chat),
+                "recent_actions_last_20": tuple(self._recent_actions),
+                "your_private_thoughts_last_10": tuple(private_thoughts) if private_thoughts else (),
+            }
+        return dict(snapshot)
 
 
 def _summarize_action_event(
     event: dict[str, Any],
-    space_key_by_index: dict[int, str],
+    space_key_by_index: Mapping[int, str],
 ) -> dict[str, Any] | None:
-    event_type = event.get("type")
-    payload = event.get("payload", {})
-    turn_index = event.get("turn_index")
-    if event_type == "PROPERTY_PURCHASED":
-        space_index = payload.get("space_index")
-        space_key = space_key_for_index(int(space_index), space_key_by_index) if space_index is not None else None
-        return {
-            "turn_index": turn_index,
-            "type": "PROPERTY_PURCHASED",
-            "player_id": payload.get("player_id"),
-            "space_key": space_key,
-            "amount": payload.get("price"),
-        }
-    if event_type == "RENT_PAID":
-        space_index = payload.get("space_index")
-        space_key = space_key_for_index(int(space_index), space_key_by_index) if space_index is not None else None
-        return {
-            "turn_index": turn_index,
-            "type": "RENT_PAID",
-            "from_player_id": payload.get("from_player_id"),
-            "to_player_id": payload.get("to_player_id"),
-            "space_key": space_key,
-            "amount": payload.get("amount"),
-        }
-    if event_type == "SENT_TO_JAIL":
-        return {
-            "turn_index": turn_index,
-            "type": "SENT_TO_JAIL",
-            "player_id": payload.get("player_id"),
-            "reason": payload.get("reason"),
-        }
-    if event_type == "CASH_CHANGED":
-        reason = payload.get("reason")
-        if reason not in {
-            "PASS_GO",
-            "TAX_INCOME",
-            "TAX_LUXURY",
-            "BANKRUPTCY",
-            "BANKRUPTCY_ASSETS_TO_BANK",
-        }:
-            return None
-        return {
-            "turn_index": turn_index,
-            "type": "CASH_CHANGED",
-            "player_id": payload.get("player_id"),
-            "delta": payload.get("delta"),
-            "reason": reason,
-        }
-    return None
+    summarize = _EVENT_SUMMARIZERS.get(event.get("type"))
+    if summarize is None:
+        return None
+    return summarize(event.get("turn_index"), event.get("payload", {}), space_key_by_index)
+
+
+def _event_space_key(payload: dict[str, Any], space_key_by_index: Mapping[int, str]) -> str | None:
+    space_index = payload.get("space_index")
+    return space_key_for_index(int(space_index), space_key_by_index) if space_index is not None else None
+
+
+def _summarize_property_purchased(
+    turn_index: Any,
+    payload: dict[str, Any],
+    space_key_by_index: Mapping[int, str],
+) -> dict[str, Any] | None:
+    return {
+        "turn_index": turn_index,
+        "type": "PROPERTY_PURCHASED",
+        "player_id": payload.get("player_id"),
+        "space_key": _event_space_key(payload, space_key_by_index),
+        "amount": payload.get("price"),
+    }
+
+
+def _summarize_rent_paid(
+    turn_index: Any,
+    payload: dict[str, Any],
+    space_key_by_index: Mapping[int, str],
+) -> dict[str, Any] | None:
+    return {
+        "turn_index": turn_index,
+        "type": "RENT_PAID",
+        "from_player_id": payload.get("from_player_id"),
+        "to_player_id": payload.get("to_player_id"),
+        "space_key": _event_space_key(payload, space_key_by_index),
+        "amount": payload.get("amount"),
+    }
+
+
+def _summarize_sent_to_jail(
+    turn_index: Any,
+    payload: dict[str, Any],
+    space_key_by_index: Mapping[int, str],
+) -> dict[str, Any] | None:
+    return {
+        "turn_index": turn_index,
+        "type": "SENT_TO_JAIL",
+        "player_id": payload.get("player_id"),
+        "reason": payload.get("reason"),
+    }
+
+
+def _summarize_cash_changed(
+    turn_index: Any,
+    payload: dict[str, Any],
+    space_key_by_index: Mapping[int, str],
+) -> dict[str, Any] | None:
+    reason = payload.get("reason")
+    if reason not in _LOGGED_CASH_CHANGE_REASONS:
+        return None
+    return {
+        "turn_index": turn_index,
+        "type": "CASH_CHANGED",
+        "player_id": payload.get("player_id"),
+        "delta": payload.get("delta"),
+        "reason": reason,
+    }
+
+
+_EventSummarizer = Callable[[Any, dict[str, Any], Mapping[int, str]], dict[str, Any] | None]
+_EVENT_SUMMARIZERS: dict[Any, _EventSummarizer] = {
+    "PROPERTY_PURCHASED": _summarize_property_purchased,
+    "RENT_PAID": _summarize_rent_paid,
+    "SENT_TO_JAIL": _summarize_sent_to_jail,
+    "CASH_CHANGED": _summarize_cash_changed,
+}
 
 
 def build_system_prompt(player: PlayerConfig) -> str:
     if player.system_prompt:
         return player.system_prompt
-    return DEFAULT_SYSTEM_PROMPT
+    return load_default_system_prompt()
 
 
 def build_full_state(
@@ -159,7 +261,7 @@ def build_full_state(
     *,
     you_player_id: str,
     memory: PromptMemory,
-    space_key_by_index: dict[int, str],
+    space_key_by_index: Mapping[int, str],
 ) -> dict[str, Any]:
     players = snapshot.get("players", [])
     if len(players) != 4:
@@ -170,37 +272,40 @@ def build_full_state(
     if you_player is None:
         you_player = players[0]
 
+    holdings_by_owner: dict[Any, dict[str, list[dict[str, Any]]]] = {}
+    for space in board:
+        owner_id = space.get("owner_id")
+        if owner_id is None:
+            continue
+        holdings = holdings_by_owner.get(owner_id)
+        if holdings is None:
+            holdings = holdings_by_owner[owner_id] = {"owned": [], "mortgaged": []}
+        space_key = space_key_for_index(space.get("index", 0), space_key_by_index)
+        mortgaged_flag = space.get("mortgaged", False)
+        holdings["owned"].append(
+            {
+                "space_key": space_key,
+                "houses": space.get("houses", 0),
+                "hotel": space.get("hotel", False),
+                "mortgaged": mortgaged_flag,
+            }
+        )
+        if mortgaged_flag:
+            holdings["mortgaged"].append({"space_key": space_key})
+
     def build_holdings(player_id: str) -> dict[str, Any]:
-        owned: list[dict[str, Any]] = []
-        mortgaged: list[dict[str, Any]] = []
-        for space in board:
-            if space.get("owner_id") != player_id:
-                continue
-            space_index = int(space.get("index", 0))
-            space_key = space_key_for_index(space_index, space_key_by_index)
-            mortgaged_flag = bool(space.get("mortgaged"))
-            owned.append(
-                {
-                    "space_key": space_key,
-                    "houses": int(space.get("houses", 0)),
-                    "hotel": bool(space.get("hotel", False)),
-                    "mortgaged": mortgaged_flag,
-                }
-            )
-            if mortgaged_flag:
-                mortgaged.append({"space_key": space_key})
-        return {"owned": owned, "mortgaged": mortgaged}
+        return holdings_by_owner.get(player_id) or {"owned": [], "mortgaged": []}
 
     def build_player_view(player: dict[str, Any]) -> dict[str, Any]:
-        position_index = int(player.get("position", 0))
+        position_index = player.get("position", 0)
         return {
             "player_id": player.get("player_id"),
             "name": player.get("name"),
             "cash": player.get("cash"),
             "position": space_key_for_index(position_index, space_key_by_index),
-            "in_jail": bool(player.get("in_jail")),
-            "has_get_out_of_jail_card": int(player.get("get_out_of_jail_cards", 0)) > 0,
-            "holdings": build_holdings(str(player.get("player_id"))),
+            "in_jail": player.get("in_jail", False),
+            "has_get_out_of_jail_card": player.get("get_out_of_jail_cards", 0) > 0,
+            "holdings": build_holdings(player["player_id"]),
         }
 
     you_view = build_player_view(you_player)
@@ -227,17 +332,24 @@ def build_full_state(
             "houses_remaining": snapshot.get("bank", {}).get("houses_remaining"),
             "hotels_remaining": snapshot.get("bank", {}).get("hotels_remaining"),
         },
-        "memory": memory.snapshot_for_player(str(you_player.get("player_id"))),
+        "memory": memory.snapshot_for_player(you_player["player_id"]),
     }
 
 
 def _augment_args_schema(args_schema: dict[str, Any] | None) -> dict[str, Any]:
-    schema = copy.deepcopy(args_schema or {"type": "object", "additionalProperties": False})
+    schema_key = orjson.dumps(args_schema or {"type": "object", "additionalProperties": False})
+    return orjson.loads(_augmented_schema_cached(schema_key))
+
+
+# Cached as encoded bytes so every caller decodes its own copy of the schema.
+@lru_cache(maxsize=256)
+def _augmented_schema_cached(schema_key: bytes) -> bytes:
+    schema = orjson.loads(schema_key)
     properties = schema.setdefault("properties", {})
     if isinstance(properties, dict):
         properties.setdefault("public_message", {"type": "string"})
         properties.setdefault("private_thought", {"type": "string"})
-    return schema
+    return orjson.dumps(schema)
 
 
 def build_compact_decision(decision: dict[str, Any]) -> dict[str, Any]:
@@ -263,19 +375,19 @@ def build_compact_decision(decision: dict[str, Any]) -> dict[str, Any]:
 
 
 def build_openrouter_tools(decision_payload: dict[str, Any]) -> list[dict[str, Any]]:
+    # Tool parameters alias the decision payload's schemas; copy before mutating them.
     tools: list[dict[str, Any]] = []
     for entry in decision_payload.get("legal_actions", []):
         action_name = entry.get("action")
         if not action_name:
             continue
-        args_schema = copy.deepcopy(entry.get("args_schema") or {})
         tools.append(
             {
                 "type": "function",
                 "function": {
                     "name": action_name,
                     "description": _describe_action(action_name),
-                    "parameters": args_schema,
+                    "parameters": entry.get("args_schema") or {},
                 },
             }
         )
@@ -283,53 +395,24 @@ def build_openrouter_tools(decision_payload: dict[str, Any]) -> list[dict[str, A
 
 
 def _describe_action(action_name: str) -> str:
-    descriptions = {
-        "buy_property": "Buy the property at the current space.",
-        "start_auction": "Decline purchase and start an auction for the current space.",
-        "bid_auction": "Place a bid in the current auction.",
-        "drop_out": "Drop out of the current auction.",
-        "propose_trade": "Propose a trade to another player.",
-        "accept_trade": "Accept the current trade offer.",
-        "reject_trade": "Reject the current trade offer.",
-        "counter_trade": "Counter the current trade offer.",
-        "ROLL_DICE": "Roll the dice to start your move.",
-        "roll_for_doubles": "Roll for doubles to attempt to leave jail.",
-        "pay_jail_fine": "Pay the jail fine to leave jail.",
-        "use_get_out_of_jail_card": "Use a Get Out of Jail Free card.",
-        "end_turn": "End your turn.",
-        "mortgage_property": "Mortgage a property you own.",
-        "unmortgage_property": "Unmortgage a property you own.",
-        "build_houses_or_hotel": "Build houses or a hotel on your monopolies.",
-        "sell_houses_or_hotel": "Sell houses or a hotel from your monopolies.",
-        "declare_bankruptcy": "Declare bankruptcy when you cannot pay.",
-        "NOOP": "Take no action.",
-    }
-    return descriptions.get(action_name, f"Take the {action_name} action.")
+    description = _ACTION_DESCRIPTIONS.get(action_name)
+    if description is None:
+        return f"Take the {action_name} action."
+    return description
 
 
 def build_decision_focus(
     decision: dict[str, Any],
     *,
-    space_key_by_index: dict[int, str],
+    space_key_by_index: Mapping[int, str],
 ) -> dict[str, Any]:
     decision_type = decision.get("decision_type")
-    if decision_type == "BUY_OR_AUCTION_DECISION":
-        return build_buy_or_auction_decision_focus(decision, space_key_by_index=space_key_by_index)
-    # TODO: expand focus payloads when engine emits richer decision contexts.
-    if decision_type == "JAIL_DECISION":
-        return build_jail_decision_focus(decision, space_key_by_index=space_key_by_index)
-    if decision_type == "POST_TURN_ACTION_DECISION":
-        return build_post_turn_action_decision_focus(decision, space_key_by_index=space_key_by_index)
-    if decision_type == "LIQUIDATION_DECISION":
-        return build_liquidation_decision_focus(decision, space_key_by_index=space_key_by_index)
-    if decision_type == "AUCTION_BID_DECISION":
-        return build_auction_bid_decision_focus(decision, space_key_by_index=space_key_by_index)
-    if decision_type == "TRADE_PROPOSE_DECISION":
-        return build_trade_propose_decision_focus(decision)
-    if decision_type == "TRADE_RESPONSE_DECISION":
-        return build_trade_response_decision_focus(decision)
-    if decision_type == "TRADE_RESPONSE":
-        return build_trade_negotiation_focus(decision)
+    board_builder = _BOARD_FOCUS_BUILDERS.get(decision_type)
+    if board_builder is not None:
+        return board_builder(decision, space_key_by_index=space_key_by_index)
+    builder = _FOCUS_BUILDERS.get(decision_type)
+    if builder is not None:
+        return builder(decision)
     return {
         "schema_version": PROMPT_SCHEMA_VERSION,
         "focus_type": "UNKNOWN_DECISION_FOCUS",
@@ -338,58 +421,84 @@ def build_decision_focus(
 
 
 def _build_legal_tools(decision: dict[str, Any], *, include_args: bool) -> list[dict[str, Any]]:
-    tools: list[dict[str, Any]] = []
-    for entry in decision.get("legal_actions", []):
-        tool_name = entry.get("action")
-        if not tool_name:
-            continue
-        tool: dict[str, Any] = {
-            "tool_name": tool_name,
-            "requires": ["public_message", "private_thought"],
-        }
-        if include_args:
-            tool["args"] = {}
-        tools.append(tool)
-    return tools
+    return [
+        _tool_entry(tool_name, _MESSAGE_REQUIRES, include_args)
+        for entry in decision.get("legal_actions", [])
+        if (tool_name := entry.get("action"))
+    ]
+
+
+def _tool_entry(tool_name: str, requires: tuple[str, ...], include_args: bool) -> dict[str, Any]:
+    tool: dict[str, Any] = {
+        "tool_name": tool_name,
+        "requires": requires,
+    }
+    if include_args:
+        tool["args"] = {}
+    return tool
 
 
-def _rent_summary(space_kind: str | None, space_index: int) -> list[int]:
+def _rent_summary(space_kind: str | None, space_index: int) -> tuple[int, ...]:
     if space_kind == "PROPERTY":
-        return PROPERTY_RENT_TABLES.get(space_index, [])
+        return _PROPERTY_RENTS.get(space_index, ())
     if space_kind == "RAILROAD":
-        return list(RAILROAD_RENTS)
+        return _RAILROAD_RENTS
     if space_kind == "UTILITY":
-        return [UTILITY_RENT_MULTIPLIER[key] for key in sorted(UTILITY_RENT_MULTIPLIER)]
-    return []
+        return _UTILITY_RENTS
+    return ()
+
+
+def _index_board(board: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+    indices = [int(space.get("index", 0)) for space in board]
+    board_by_index: list[dict[str, Any] | None] = [None] * (max(indices, default=-1) + 1)
+    for index, space in zip(indices, board):
+        if index >= 0 and board_by_index[index] is None:
+            board_by_index[index] = space
+    return board_by_index
+
+
+def _space_at(board_by_index: list[dict[str, Any] | None], index: int) -> dict[str, Any] | None:
+    if 0 <= index < len(board_by_index):
+        return board_by_index[index]
+    return None
+
 
+def _find_space(board: list[dict[str, Any]], index: int) -> dict[str, Any] | None:
+    if 0 <= index < len(board) and board[index].get("index") == index:
+        return board[index]
+    return next((space for space in board if space.get("index") == index), None)
 
-def _group_progress(board: list[dict[str, Any]], player_id: str | None, group: str | None) -> dict[str, int]:
+
+def _group_progress(
+    board_by_index: list[dict[str, Any] | None],
+    player_id: str | None,
+    group: str | None,
+) -> dict[str, int]:
     if not group or not player_id:
         return {"you_own_in_group": 0, "total_in_group": 0}
-    indices = GROUP_INDEXES.get(group, [])
+    indices = GROUP_INDEXES.get(group, ())
     if not indices:
         return {"you_own_in_group": 0, "total_in_group": 0}
-    board_by_index = {int(space.get("index", 0)): space for space in board}
-    owned = sum(
-        1 for index in indices if board_by_index.get(index, {}).get("owner_id") == player_id
-    )
+    owned = 0
+    for index in indices:
+        space = _space_at(board_by_index, index)
+        if space is not None and space.get("owner_id") == player_id:
+            owned += 1
     return {"you_own_in_group": owned, "total_in_group": len(indices)}
 
 
 def build_buy_or_auction_decision_focus(
     decision: dict[str, Any],
     *,
-    space_key_by_index: dict[int, str],
+    space_key_by_index: Mapping[int, str],
 ) -> dict[str, Any]:
     state = decision.get("state", {})
-    board = state.get("board", [])
+    board_by_index = _index_board(state.get("board", []))
     active_player_id = decision.get("player_id")
-    active_player: dict[str, Any] = next(
-        (player for player in state.get("players", []) if player.get("player_id") == active_player_id),
-        {},
-    )
+    players_by_id = {player.get("player_id"): player for player in state.get("players", [])}
+    active_player: dict[str, Any] = players_by_id.get(active_player_id) or {}
     position_index = int(active_player.get("position", 0))
-    landed_space = next((space for space in board if space.get("index") == position_index), None)
+    landed_space = _space_at(board_by_index, position_index)
     if landed_space is None:
         landed_space = {"index": position_index}
     space_kind = landed_space.get("kind")
@@ -409,7 +518,7 @@ def build_buy_or_auction_decision_focus(
             "price": landed_space.get("price"),
             "house_cost": house_cost,
             "rent": rent,
-            "group_progress": _group_progress(board, active_player_id, group),
+            "group_progress": _group_progress(board_by_index, active_player_id, group),
         },
         "legal_tools": _build_legal_tools(decision, include_args=True),
     }
@@ -418,7 +527,7 @@ def build_buy_or_auction_decision_focus(
 def build_jail_decision_focus(
     decision: dict[str, Any],
     *,
-    space_key_by_index: dict[int, str],
+    space_key_by_index: Mapping[int, str],
 ) -> dict[str, Any]:
     tool_names = {entry.get("action") for entry in decision.get("legal_actions", [])}
     return {
@@ -439,30 +548,12 @@ def build_jail_decision_focus(
     }
 
 
-def _tool_requires(action_name: str) -> list[str]:
-    if action_name == "propose_trade":
-        return ["to_player_id", "offer", "request", "public_message", "private_thought"]
-    if action_name == "counter_trade":
-        return ["offer", "request", "public_message", "private_thought"]
-    if action_name in {"accept_trade", "reject_trade"}:
-        return ["public_message", "private_thought"]
-    if action_name in {"mortgage_property", "unmortgage_property"}:
-        return ["space_key", "public_message", "private_thought"]
-    if action_name == "build_houses_or_hotel":
-        return ["build_plan", "public_message", "private_thought"]
-    if action_name == "sell_houses_or_hotel":
-        return ["sell_plan", "public_message", "private_thought"]
-    return ["public_message", "private_thought"]
+def _tool_requires(action_name: str) -> tuple[str, ...]:
+    return _TOOL_REQUIRES.get(action_name, _MESSAGE_REQUIRES)
 
 
 def _lean_tool_entry(action_name: str, *, include_args: bool) -> dict[str, Any]:
-    tool: dict[str, Any] = {
-        "tool_name": action_name,
-        "requires": _tool_requires(action_name),
-    }
-    if include_args:
-        tool["args"] = {}
-    return tool
+    return _tool_entry(action_name, _tool_requires(action_name), include_args)
 
 
 def _build_post_turn_legal_tools(decision: dict[str, Any]) -> list[dict[str, Any]]:
@@ -489,17 +580,17 @@ def _build_liquidation_legal_tools(decision: dict[str, Any]) -> list[dict[str, A
 
 def _space_keys_for_indices(
     indices: list[int] | None,
-    space_key_by_index: dict[int, str],
+    space_key_by_index: Mapping[int, str],
 ) -> list[str]:
     if not indices:
         return []
-    return [space_key_for_index(int(index), space_key_by_index) for index in indices]
+    return [space_key_for_index(operator.index(index), space_key_by_index) for index in indices]
 
 
 def build_post_turn_action_decision_focus(
     decision: dict[str, Any],
     *,
-    space_key_by_index: dict[int, str],
+    space_key_by_index: Mapping[int, str],
 ) -> dict[str, Any]:
     post_turn = decision.get("post_turn", {})
     options = post_turn.get("options", {}) if isinstance(post_turn, dict) else {}
@@ -537,7 +628,7 @@ def build_post_turn_action_decision_focus(
 def build_liquidation_decision_focus(
     decision: dict[str, Any],
     *,
-    space_key_by_index: dict[int, str],
+    space_key_by_index: Mapping[int, str],
 ) -> dict[str, Any]:
     liquidation = decision.get("liquidation", {})
     options = liquidation.get("options", {}) if isinstance(liquidation, dict) else {}
@@ -571,7 +662,7 @@ def build_liquidation_decision_focus(
 def build_auction_bid_decision_focus(
     decision: dict[str, Any],
     *,
-    space_key_by_index: dict[int, str],
+    space_key_by_index: Mapping[int, str],
 ) -> dict[str, Any]:
     state = decision.get("state", {})
     auction = state.get("auction", {}) if isinstance(state, dict) else {}
@@ -580,8 +671,7 @@ def build_auction_bid_decision_focus(
     if property_space_key:
         space_index = SPACE_INDEX_BY_KEY.get(property_space_key)
         if space_index is not None:
-            board = state.get("board", [])
-            space = next((entry for entry in board if entry.get("index") == space_index), None)
+            space = _find_space(state.get("board", []), space_index)
             if space:
                 group = space.get("group")
     current_high_bid = int(auction.get("current_high_bid", 0) or 0)
@@ -773,19 +863,34 @@ def build_end_turn_focus(decision: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+# TODO: expand focus payloads when engine emits richer decision contexts.
+_BOARD_FOCUS_BUILDERS: dict[Any, Callable[..., dict[str, Any]]] = {
+    "BUY_OR_AUCTION_DECISION": build_buy_or_auction_decision_focus,
+    "JAIL_DECISION": build_jail_decision_focus,
+    "POST_TURN_ACTION_DECISION": build_post_turn_action_decision_focus,
+    "LIQUIDATION_DECISION": build_liquidation_decision_focus,
+    "AUCTION_BID_DECISION": build_auction_bid_decision_focus,
+}
+_FOCUS_BUILDERS: dict[Any, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "TRADE_PROPOSE_DECISION": build_trade_propose_decision_focus,
+    "TRADE_RESPONSE_DECISION": build_trade_response_decision_focus,
+    "TRADE_RESPONSE": build_trade_negotiation_focus,
+}
+
+
 def build_prompt_bundle(
     decision: dict[str, Any],
     player: PlayerConfig,
     *,
     memory: PromptMemory,
-    space_key_by_index: dict[int, str],
+    space_key_by_index: Mapping[int, str],
     retry_errors: list[str] | None = None,
 ) -> PromptBundle:
     system_prompt = build_system_prompt(player)
     state = decision.get("state", {})
     full_state = build_full_state(
         state,
-        you_player_id=str(decision.get("player_id")),
+        you_player_id=decision["player_id"],
         memory=memory,
         space_key_by_index=space_key_by_index,
     )
@@ -800,8 +905,8 @@ def build_prompt_bundle(
         "decision_focus": decision_focus,
     }
     if player.reasoning is not None:
-        payload["llm"] = {"reasoning": player.reasoning}
-    user_content = json.dumps(payload, ensure_ascii=True, separators=(",", ":"))
+        payload["llm"] = {"reasoning": dict(player.reasoning)}
+    user_content = _encode_user_content(payload)
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_content},
@@ -814,19 +919,38 @@ def build_prompt_bundle(
     )
 
 
+def _encode_user_content(payload: dict[str, Any]) -> str:
+    # orjson formats exponent and non-finite floats differently from json.dumps, so only float-free payloads use it.
+    if not _contains_float(payload):
+        try:
+            encoded = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if encoded.isascii():
+                return encoded.decode("ascii")
+    return json.dumps(payload, ensure_ascii=True, separators=(",", ":"))
+
+
+def _contains_float(value: Any) -> bool:
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        return any(isinstance(key, float) or _contains_float(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_float(item) for item in value)
+    return False
+
+
 def _with_retry_notes(decision_focus: dict[str, Any], errors: list[str]) -> dict[str, Any]:
-    focus = copy.deepcopy(decision_focus)
+    focus = dict(decision_focus)
     target = focus.get("scenario")
     if isinstance(target, dict):
-        notes = target.get("notes")
-        if not isinstance(notes, list):
-            notes = []
-            target["notes"] = notes
+        target = focus["scenario"] = dict(target)
     else:
-        notes = focus.get("notes")
-        if not isinstance(notes, list):
-            notes = []
-            focus["notes"] = notes
+        target = focus
+    notes = target.get("notes")
+    notes = target["notes"] = list(notes) if isinstance(notes, list) else []
     notes.append(f"Previous validation errors: {', '.join(errors)}")
     notes.append("Respond with a valid tool call only. No freeform text.")
     return focus
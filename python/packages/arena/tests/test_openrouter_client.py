@@ -0,0 +1,87 @@
+"""Tests for the OpenRouter HTTP client."""
+import asyncio
+import json
+from typing import Any
+
+import httpx
+from monopoly_arena import openrouter_client
+from monopoly_arena.openrouter_client import OpenRouterClient, _parse_retry_after
+
+
+def _mock_client(responses: list[httpx.Response]) -> httpx.AsyncClient:
+    queue = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return queue.pop(0)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_parse_retry_after_seconds_and_dates() -> None:
+    """Retry-After accepts delta-seconds and HTTP-dates; junk is ignored."""
+    assert _parse_retry_after("2") == 2.0
+    assert _parse_retry_after(" 1.5 ") == 1.5
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after("nan") is None
+
+
+def test_retry_after_header_drives_retry_delay(monkeypatch) -> None:
+    """A 429 with Retry-After sleeps for the server hint, clamped to the max."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(openrouter_client.asyncio, "sleep", fake_sleep)
+    client = OpenRouterClient(api_key="test-key", max_retries=2)
+    client._client = _mock_client(
+        [
+            httpx.Response(429, headers={"retry-after": "3"}),
+            httpx.Response(503, headers={"retry-after": "600"}),
+            httpx.Response(200, json={"id": "resp-1", "choices": []}),
+        ]
+    )
+
+    async def run() -> Any:
+        try:
+            return await client.create_chat_completion(model="m", messages=[])
+        finally:
+            await client.aclose()
+
+    result = asyncio.run(run())
+    assert result.ok
+    assert delays == [3.0, openrouter_client.MAX_RETRY_AFTER_S]
+
+
+def test_request_body_matches_payload() -> None:
+    """The spliced request body decodes to the full chat-completion payload."""
+    captured: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request.content)
+        return httpx.Response(200, json={"id": "resp-1", "choices": []})
+
+    client = OpenRouterClient(api_key="test-key")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    messages = [
+        {"role": "system", "content": "Play to win."},
+        {"role": "user", "content": '{"decision":{}}'},
+    ]
+    tools = [{"type": "function", "function": {"name": "end_turn", "parameters": {}}}]
+
+    async def run() -> None:
+        for _ in range(2):
+            await client.create_chat_completion(model="m", messages=messages, tools=tools, tool_choice="required")
+        await client.aclose()
+
+    asyncio.run(run())
+    expected = {
+        "model": "m",
+        "messages": messages,
+        "temperature": 0.0,
+        "tools": tools,
+        "tool_choice": "required",
+    }
+    assert [json.loads(body) for body in captured] == [expected, expected]
@@ -2,25 +2,19 @@ from __future__ import annotations
 
 import json
 import re
-from functools import lru_cache
-from pathlib import Path
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from .models import SpaceState
+from .paths import resolve_repo_root
 
+_SPACE_KEY_SEPARATOR_RE = re.compile(r"[^A-Za-z0-9]+")
 
-def _resolve_repo_root() -> Path:
-    start = Path(__file__).resolve()
-    current = start if start.is_dir() else start.parent
-    for parent in [current, *current.parents]:
-        if (parent / "contracts").is_dir():
-            return parent
-    raise RuntimeError("Repo root not found (expected a contracts/ directory).")
 
-
-@lru_cache(maxsize=1)
 def _load_board_spec() -> dict[str, Any]:
-    board_path = _resolve_repo_root() / "contracts" / "data" / "board.json"
+    board_path = resolve_repo_root() / "contracts" / "data" / "board.json"
     spec = json.loads(board_path.read_text(encoding="utf-8"))
     if spec.get("schema_version") != "v1":
         raise ValueError("Unsupported board schema_version (expected v1).")
@@ -52,7 +46,7 @@ def _parse_int_keyed_dict(value: Any, *, field: str) -> dict[int, Any]:
 
 
 def normalize_space_key(name: str) -> str:
-    cleaned = re.sub(r"[^A-Za-z0-9]+", "_", name.strip())
+    cleaned = _SPACE_KEY_SEPARATOR_RE.sub("_", name.strip())
     return cleaned.strip("_").upper()
 
 
@@ -63,11 +57,11 @@ def _build_board_spec_tuples(spec: dict[str, Any]) -> list[tuple[int, str, str,
         if not isinstance(space, dict):
             raise TypeError("board.json spaces[] must contain objects")
         index = int(space.get("index", 0))
-        kind = str(space.get("kind", ""))
+        kind = sys.intern(str(space.get("kind", "")))
         name = str(space.get("name", ""))
         group = space.get("group")
         if group is not None:
-            group = str(group)
+            group = sys.intern(str(group))
         price = space.get("price")
         if price is not None:
             price = int(price)
@@ -78,9 +72,15 @@ def _build_board_spec_tuples(spec: dict[str, Any]) -> list[tuple[int, str, str,
 _SPEC = _load_board_spec()
 
 BOARD_SPEC: list[tuple[int, str, str, str | None, int | None]] = _build_board_spec_tuples(_SPEC)
-SPACE_KEY_BY_INDEX: dict[int, str] = {
-    index: normalize_space_key(name) for index, _, name, _, _ in BOARD_SPEC
-}
+SPACE_KEY_BY_INDEX: dict[int, str] = {}
+_group_indexes: dict[str, list[int]] = {}
+_kind_indexes: dict[str, list[int]] = {}
+for index, kind, name, group, _price in BOARD_SPEC:
+    SPACE_KEY_BY_INDEX[index] = sys.intern(normalize_space_key(name))
+    _kind_indexes.setdefault(kind, []).append(index)
+    if group:
+        _group_indexes.setdefault(group, []).append(index)
+SPACE_KEYS: tuple[str, ...] = tuple(SPACE_KEY_BY_INDEX.values())
 SPACE_INDEX_BY_KEY: dict[str, int] = {space_key: index for index, space_key in SPACE_KEY_BY_INDEX.items()}
 
 PROPERTY_RENT_TABLES: dict[int, list[int]] = {
@@ -102,16 +102,15 @@ HOUSE_COST_BY_GROUP: dict[str, int] = {
     for key, value in _required_dict(_SPEC.get("house_cost_by_group"), field="house_cost_by_group").items()
 }
 
-OWNABLE_KINDS = {"PROPERTY", "RAILROAD", "UTILITY"}
+OWNABLE_KINDS = frozenset({"PROPERTY", "RAILROAD", "UTILITY"})
 
-GROUP_INDEXES: dict[str, list[int]] = {}
-for index, kind, _name, group, _price in BOARD_SPEC:
-    if group:
-        GROUP_INDEXES.setdefault(group, []).append(index)
+GROUP_INDEXES: Mapping[str, tuple[int, ...]] = MappingProxyType(
+    {group: tuple(indexes) for group, indexes in _group_indexes.items()}
+)
+KIND_INDEXES: Mapping[str, tuple[int, ...]] = MappingProxyType(
+    {kind: tuple(indexes) for kind, indexes in _kind_indexes.items()}
+)
 
 
 def build_board() -> list[SpaceState]:
-    return [
-        SpaceState(index=index, kind=kind, name=name, group=group, price=price)
-        for index, kind, name, group, price in BOARD_SPEC
-    ]
+    return [SpaceState(*space) for space in BOARD_SPEC]
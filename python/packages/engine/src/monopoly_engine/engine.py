@@ -6,11 +6,12 @@ from typing import Any
 from .board import (
     GROUP_INDEXES,
     HOUSE_COST_BY_GROUP,
+    KIND_INDEXES,
     OWNABLE_KINDS,
     PROPERTY_RENT_TABLES,
     RAILROAD_RENTS,
-    SPACE_KEY_BY_INDEX,
     SPACE_INDEX_BY_KEY,
+    SPACE_KEYS,
     TAX_AMOUNTS,
     UTILITY_RENT_MULTIPLIER,
     build_board,
@@ -1563,7 +1564,7 @@ class Engine:
         space = self.state.board[space_index]
         if space.owner_id is not None or space.kind not in OWNABLE_KINDS:
             return None
-        property_space_key = SPACE_KEY_BY_INDEX.get(space.index) or normalize_space_key(space.name)
+        property_space_key = SPACE_KEYS[space.index]
         bidders = self._auction_bidders_in_order(player.player_id)
         if not bidders:
             return None
@@ -2403,13 +2404,13 @@ class Engine:
         return int(space.houses)
 
     def _group_has_buildings(self, group: str) -> bool:
-        indices = GROUP_INDEXES.get(group, [])
+        indices = GROUP_INDEXES.get(group, ())
         return any(
             self.state.board[index].houses > 0 or self.state.board[index].hotel for index in indices
         )
 
     def _group_has_mortgaged(self, group: str) -> bool:
-        indices = GROUP_INDEXES.get(group, [])
+        indices = GROUP_INDEXES.get(group, ())
         return any(self.state.board[index].mortgaged for index in indices)
 
     @staticmethod
@@ -2685,7 +2686,7 @@ class Engine:
                 raise ValueError("Invalid build target.")
             if not all(
                 self.state.board[index].owner_id == player.player_id
-                for index in GROUP_INDEXES.get(space.group, [])
+                for index in GROUP_INDEXES.get(space.group, ())
             ):
                 raise ValueError("Cannot build without monopoly.")
             if self._group_has_mortgaged(space.group):
@@ -2720,7 +2721,7 @@ class Engine:
         if player.cash < total_cost:
             raise ValueError("Insufficient cash to build.")
         for group in touched_groups:
-            indices = GROUP_INDEXES.get(group, [])
+            indices = GROUP_INDEXES.get(group, ())
             values = [
                 HOTEL_HOUSE_EQUIV if temp[index][1] else temp[index][0] for index in indices
             ]
@@ -2776,7 +2777,7 @@ class Engine:
         if self.state.bank.houses_remaining + bank_houses_delta < 0:
             raise ValueError("Insufficient bank houses for hotel sale.")
         for group in touched_groups:
-            indices = GROUP_INDEXES.get(group, [])
+            indices = GROUP_INDEXES.get(group, ())
             values = [
                 HOTEL_HOUSE_EQUIV if temp[index][1] else temp[index][0] for index in indices
             ]
@@ -2823,7 +2824,8 @@ class Engine:
         )
 
     def _count_owned(self, player_id: str, kind: str) -> int:
-        return sum(1 for space in self.state.board if space.kind == kind and space.owner_id == player_id)
+        board = self.state.board
+        return sum(1 for index in KIND_INDEXES.get(kind, ()) if board[index].owner_id == player_id)
 
     def _pay_rent(
         self,
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+REPO_ROOT_ENV = "MONOPOLY_REPO_ROOT"
+
+
+def _is_repo_root(path: Path) -> bool:
+    return (path / "contracts").is_dir()
+
+
+def resolve_repo_root() -> Path:
+    override = os.getenv(REPO_ROOT_ENV)
+    if override:
+        root = Path(override).resolve()
+        if not _is_repo_root(root):
+            raise RuntimeError(f"{REPO_ROOT_ENV}={override!r} is not a repo root (expected a contracts/ directory).")
+        return root
+    return _discover_repo_root()
+
+
+@lru_cache(maxsize=1)
+def _discover_repo_root() -> Path:
+    current = Path(__file__).resolve().parent
+    for parent in [current, *current.parents]:
+        if _is_repo_root(parent):
+            return parent
+    raise RuntimeError("Repo root not found (expected a contracts/ directory).")
@@ -1,8 +1,11 @@
 from monopoly_engine.board import (
     BOARD_SPEC,
     HOUSE_COST_BY_GROUP,
+    KIND_INDEXES,
     PROPERTY_RENT_TABLES,
     RAILROAD_RENTS,
+    SPACE_KEY_BY_INDEX,
+    SPACE_KEYS,
     TAX_AMOUNTS,
     UTILITY_RENT_MULTIPLIER,
 )
@@ -12,6 +15,13 @@ def test_board_spec_has_40_spaces_with_contiguous_indexes() -> None:
     assert len(BOARD_SPEC) == 40
     indexes = [index for index, _, _, _, _ in BOARD_SPEC]
     assert indexes == list(range(40))
+    assert SPACE_KEYS == tuple(SPACE_KEY_BY_INDEX[index] for index in indexes)
+
+
+def test_kind_indexes_partition_the_board() -> None:
+    assert KIND_INDEXES["RAILROAD"] == (5, 15, 25, 35)
+    assert KIND_INDEXES["UTILITY"] == (12, 28)
+    assert sorted(index for indexes in KIND_INDEXES.values() for index in indexes) == list(range(40))
 
 
 def test_board_rent_and_tax_tables_match_expected_invariants() -> None:
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+import pytest
+from monopoly_engine.paths import REPO_ROOT_ENV, resolve_repo_root
+
+
+def test_repo_root_env_override_is_used(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    (tmp_path / "contracts").mkdir()
+    monkeypatch.setenv(REPO_ROOT_ENV, str(tmp_path))
+    assert resolve_repo_root() == tmp_path.resolve()
+
+
+def test_repo_root_env_override_requires_contracts(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(REPO_ROOT_ENV, str(tmp_path))
+    with pytest.raises(RuntimeError, match=REPO_ROOT_ENV):
+        resolve_repo_root()
+
+
+def test_repo_root_is_discovered_without_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(REPO_ROOT_ENV, raising=False)
+    assert (resolve_repo_root() / "contracts").is_dir()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from pathlib import Path
 from typing import Any
@@ -324,6 +325,13 @@ def _read_jsonl(path: Path) -> list[dict[str, Any]]:
 
 
 def _resolve_repo_root() -> Path:
+    # Mirrors monopoly_engine.paths.resolve_repo_root; telemetry does not depend on the engine.
+    override = os.getenv("MONOPOLY_REPO_ROOT")
+    if override:
+        root = Path(override).resolve()
+        if not (root / "contracts").is_dir():
+            raise RuntimeError(f"MONOPOLY_REPO_ROOT={override!r} is not a repo root (expected contracts/).")
+        return root
     start = Path(__file__).resolve()
     current = start if start.is_dir() else start.parent
     for parent in [current, *current.parents]: